@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from asyncio import CancelledError
+from asyncio import CancelledError, Semaphore, gather
+from collections.abc import Awaitable, Callable
 from contextlib import suppress
-from datetime import datetime
-from typing import Any
+from functools import partial
+from typing import Any, Final
 
 from aiohttp import ClientConnectorError
 from homeassistant.components import bluetooth
@@ -17,7 +18,7 @@ from homeassistant.components.bluetooth import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, EVENT_HOMEASSISTANT_STOP, Platform
-from homeassistant.core import Event, HassJob, HomeAssistant
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
     ConfigEntryError,
@@ -29,7 +30,6 @@ from homeassistant.helpers.device_registry import DeviceEntry
 from homeassistant.helpers.device_registry import (
     async_get as async_get_device_registry,
 )
-from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.storage import Store
 from homeassistant.loader import async_get_integration
 from pymammotion.aliyun.exceptions import TooManyRequestsException
@@ -79,6 +79,7 @@ from .coordinator import (
     MammotionReportUpdateCoordinator,
     MammotionRTKCoordinator,
     MammotionSpinoCoordinator,
+    async_update_entry_data_if_changed,
 )
 from .models import (
     MammotionDevices,
@@ -88,7 +89,7 @@ from .models import (
 )
 from .services import async_setup_services
 
-PLATFORMS: list[Platform] = [
+PLATFORMS: Final[tuple[Platform, ...]] = (
     Platform.BINARY_SENSOR,
     Platform.LAWN_MOWER,
     Platform.DEVICE_TRACKER,
@@ -100,7 +101,11 @@ PLATFORMS: list[Platform] = [
     Platform.CAMERA,
     Platform.UPDATE,
     Platform.VACUUM,
-]
+)
+
+# Upper bound on devices running their first cloud refreshes at the same time,
+# so large accounts don't flood the Mammotion API during startup.
+MAX_CONCURRENT_DEVICE_SETUPS = 4
 
 type MammotionConfigEntry = ConfigEntry[MammotionDevices]
 
@@ -110,6 +115,15 @@ def _has_ble_devices(entry: MammotionConfigEntry) -> bool:
     return bool(entry.data.get(CONF_BLE_DEVICES))
 
 
+def _disable_cloud_account(hass: HomeAssistant, entry: MammotionConfigEntry) -> None:
+    """Mark the entry as BLE-only, skipping the data copy if already marked."""
+    if entry.data.get(CONF_HAS_CLOUD_ACCOUNT) is False:
+        return
+    hass.config_entries.async_update_entry(
+        entry, data={**entry.data, CONF_HAS_CLOUD_ACCOUNT: False}
+    )
+
+
 async def _async_attempt_login(
     hass: HomeAssistant,
     entry: MammotionConfigEntry,
@@ -142,9 +156,7 @@ async def _async_attempt_login(
             LOGGER.warning(
                 "Mammotion login failed; continuing in BLE-only mode: %s", err
             )
-            hass.config_entries.async_update_entry(
-                entry, data={**entry.data, CONF_HAS_CLOUD_ACCOUNT: False}
-            )
+            _disable_cloud_account(hass, entry)
             return False
         raise ConfigEntryAuthFailed(err) from err
     except EXPIRED_CREDENTIAL_EXCEPTIONS as exc:
@@ -178,9 +190,7 @@ async def _async_attempt_login(
                     "Login failed after cache clear; continuing in BLE-only mode: %s",
                     retry_err,
                 )
-                hass.config_entries.async_update_entry(
-                    entry, data={**entry.data, CONF_HAS_CLOUD_ACCOUNT: False}
-                )
+                _disable_cloud_account(hass, entry)
                 return False
             raise ConfigEntryAuthFailed(retry_err) from retry_err
     except AccountInUseError as err:
@@ -321,14 +331,265 @@ async def _await_device_connection(
         raise HomeAssistantError("Setup cancelled, transport connection timed out")
 
 
+async def _async_setup_mower(
+    hass: HomeAssistant,
+    entry: MammotionConfigEntry,
+    mammotion: MammotionClient,
+    device: Device,
+    ble_address: str | None,
+    *,
+    use_wifi: bool,
+    prefer_ble: bool,
+    mow_path_fetch_enabled: bool,
+) -> MammotionMowerData:
+    """Attach transports, create coordinators and run first refreshes for a mower."""
+    if ble_address:
+        await _attach_ble_to_mower(
+            hass,
+            entry,
+            mammotion,
+            device,
+            ble_address,
+        )
+
+    if not use_wifi:
+        mammotion.set_prefer_ble(device.device_name, prefer_ble=True)
+        handle = mammotion.mower(device.device_name)
+        if handle is not None:
+            for t_type in (
+                TransportType.CLOUD_ALIYUN,
+                TransportType.CLOUD_MAMMOTION,
+            ):
+                await handle.disconnect_transport(t_type)
+    elif prefer_ble:
+        mammotion.set_prefer_ble(device.device_name, prefer_ble=True)
+
+    mammotion.set_mow_path_fetch_enabled(
+        device.device_name, enabled=mow_path_fetch_enabled
+    )
+
+    unique_name = device.device_name
+
+    maintenance_coordinator = MammotionMaintenanceUpdateCoordinator(
+        hass, entry, device, mammotion, unique_name=unique_name
+    )
+    version_coordinator = MammotionDeviceVersionUpdateCoordinator(
+        hass, entry, device, mammotion, unique_name=unique_name
+    )
+    report_coordinator = MammotionReportUpdateCoordinator(
+        hass, entry, device, mammotion, unique_name=unique_name
+    )
+    map_coordinator = MammotionMapUpdateCoordinator(
+        hass, entry, device, mammotion, unique_name=unique_name
+    )
+    error_coordinator = MammotionDeviceErrorUpdateCoordinator(
+        hass, entry, device, mammotion, unique_name=unique_name
+    )
+
+    await _await_device_connection(
+        mammotion,
+        device.device_name,
+        prefer_ble=(not use_wifi or prefer_ble),
+    )
+
+    await report_coordinator.async_restore_data()
+    await version_coordinator.async_config_entry_first_refresh()
+
+    await report_coordinator.async_config_entry_first_refresh()
+    await maintenance_coordinator.async_config_entry_first_refresh()
+
+    await error_coordinator.async_config_entry_first_refresh()
+    await map_coordinator._async_setup()
+
+    entry.async_create_background_task(
+        hass,
+        map_coordinator.async_request_refresh(),
+        f"{DOMAIN}-{unique_name}-map-refresh",
+    )
+
+    return MammotionMowerData(
+        name=device.device_name,
+        unique_name=unique_name,
+        device=device,
+        api=mammotion,
+        maintenance_coordinator=maintenance_coordinator,
+        reporting_coordinator=report_coordinator,
+        version_coordinator=version_coordinator,
+        map_coordinator=map_coordinator,
+        error_coordinator=error_coordinator,
+    )
+
+
+async def _async_setup_rtk(
+    hass: HomeAssistant,
+    entry: MammotionConfigEntry,
+    mammotion: MammotionClient,
+    rtk: Device,
+    ble_address: str | None,
+) -> MammotionRTKData:
+    """Attach transports, create the coordinator and run first refresh for an RTK."""
+    if ble_address:
+        await _attach_ble_to_rtk(
+            hass,
+            entry,
+            mammotion,
+            rtk,
+            ble_address,
+        )
+
+    rtk_unique_name = rtk.device_name
+    rtk_coordinator = MammotionRTKCoordinator(
+        hass, entry, rtk, mammotion, unique_name=rtk_unique_name
+    )
+    await rtk_coordinator.async_restore_data()
+    await rtk_coordinator.async_config_entry_first_refresh()
+    return MammotionRTKData(
+        name=rtk.device_name,
+        unique_name=rtk_unique_name,
+        api=mammotion,
+        device=rtk,
+        coordinator=rtk_coordinator,
+    )
+
+
+async def _async_setup_spino(
+    hass: HomeAssistant,
+    entry: MammotionConfigEntry,
+    mammotion: MammotionClient,
+    spino: Device,
+) -> MammotionSpinoData:
+    """Create the coordinator and run first refresh for a Spino pool cleaner."""
+    spino_unique_name = spino.device_name
+    spino_coordinator = MammotionSpinoCoordinator(
+        hass, entry, spino, mammotion, unique_name=spino_unique_name
+    )
+    await spino_coordinator.async_restore_data()
+    await spino_coordinator.async_config_entry_first_refresh()
+    return MammotionSpinoData(
+        name=spino.device_name,
+        unique_name=spino_unique_name,
+        api=mammotion,
+        device=spino,
+        coordinator=spino_coordinator,
+    )
+
+
+async def _async_setup_ble_only_mower(
+    hass: HomeAssistant,
+    entry: MammotionConfigEntry,
+    mammotion: MammotionClient,
+    device_name: str,
+    ble_address: str,
+) -> MammotionMowerData:
+    """Register a BLE-only mower, create coordinators and run first refreshes."""
+    ble_device = bluetooth.async_ble_device_from_address(
+        hass, ble_address.upper(), True
+    )
+
+    # Register the device regardless of whether it is currently in range.
+    # If ble_device is None the transport is created with just the address;
+    # _register_ble_reconnect_callback will push the BLEDevice when the
+    # device is first seen.  Raising ConfigEntryNotReady here retries the
+    # ENTIRE entry, orphaning any already-registered devices and their
+    # active BLE connections.
+    if ble_device is not None:
+        await mammotion.add_ble_only_device(
+            device_id=device_name,
+            device_name=device_name,
+            ble_device=ble_device,
+            initial_device=MowingDevice(name=device_name),
+        )
+    else:
+        LOGGER.info(
+            "BLE device %s (%s) not in range at startup — registering and waiting",
+            device_name,
+            ble_address,
+        )
+        await mammotion.add_ble_only_device(
+            device_id=device_name,
+            device_name=device_name,
+            ble_address=ble_address,
+            initial_device=MowingDevice(name=device_name),
+        )
+
+    _register_ble_reconnect_callback(hass, entry, mammotion, device_name, ble_address)
+
+    synthetic_device = _create_ble_only_device(device_name)
+    unique_name = device_name
+
+    maintenance_coordinator = MammotionMaintenanceUpdateCoordinator(
+        hass, entry, synthetic_device, mammotion, unique_name=unique_name
+    )
+    version_coordinator = MammotionDeviceVersionUpdateCoordinator(
+        hass, entry, synthetic_device, mammotion, unique_name=unique_name
+    )
+    report_coordinator = MammotionReportUpdateCoordinator(
+        hass, entry, synthetic_device, mammotion, unique_name=unique_name
+    )
+    map_coordinator = MammotionMapUpdateCoordinator(
+        hass, entry, synthetic_device, mammotion, unique_name=unique_name
+    )
+    error_coordinator = MammotionDeviceErrorUpdateCoordinator(
+        hass, entry, synthetic_device, mammotion, unique_name=unique_name
+    )
+
+    await report_coordinator.async_restore_data()
+    if ble_device is not None:
+        # In range — connect BLE and wait until it's up (30s cap) before
+        # the coordinators start polling.
+        await _await_device_connection(mammotion, device_name, prefer_ble=True)
+        await version_coordinator.async_config_entry_first_refresh()
+        await report_coordinator.async_config_entry_first_refresh()
+        await maintenance_coordinator.async_config_entry_first_refresh()
+        await error_coordinator.async_config_entry_first_refresh()
+    else:
+        # Device not in range — do a best-effort refresh that won't raise
+        # ConfigEntryNotReady.  Coordinators will retry on their normal
+        # schedule; entities show unavailable until the device connects.
+        await version_coordinator.async_refresh()
+        await report_coordinator.async_refresh()
+        await maintenance_coordinator.async_refresh()
+        await error_coordinator.async_refresh()
+    await map_coordinator._async_setup()
+
+    return MammotionMowerData(
+        name=device_name,
+        unique_name=unique_name,
+        device=synthetic_device,
+        api=mammotion,
+        maintenance_coordinator=maintenance_coordinator,
+        reporting_coordinator=report_coordinator,
+        version_coordinator=version_coordinator,
+        map_coordinator=map_coordinator,
+        error_coordinator=error_coordinator,
+    )
+
+
+def _unwrap_setup_results[T](results: list[T | BaseException]) -> list[T]:
+    """Return gathered device setup results, raising the first failure."""
+    devices: list[T] = []
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+        devices.append(result)
+    return devices
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: MammotionConfigEntry) -> bool:
     """Set up Mammotion from a config entry."""
 
     addresses = entry.data.get(CONF_BLE_DEVICES, {})
     integration = await async_get_integration(hass, DOMAIN)
-    mammotion = MammotionClient(ha_version=integration.version.split("-")[0])
+    mammotion = MammotionClient(ha_version=integration.version.partition("-")[0])
+
+    stopped = False
 
     async def shutdown_mammotion(_: Event | None = None) -> None:
+        # Reached from both the HA stop event and entry unload; only stop once.
+        nonlocal stopped
+        if stopped:
+            return
+        stopped = True
         await mammotion.stop()
 
     entry.async_on_unload(
@@ -341,9 +602,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: MammotionConfigEntry) ->
     use_wifi = entry.data.get(CONF_USE_WIFI, True)
 
     # Migrate options: move from stay_connected_bluetooth to prefer_ble default.
-    if not entry.options:
-        hass.config_entries.async_update_entry(entry, options={CONF_PREFER_BLE: True})
-    elif (
+    # Entries without options need no write: every reader of CONF_PREFER_BLE
+    # already defaults it to True.
+    if (
         CONF_STAY_CONNECTED_BLUETOOTH in entry.options
         and CONF_PREFER_BLE not in entry.options
     ):
@@ -383,6 +644,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: MammotionConfigEntry) ->
 
     cloud_available = False
 
+    setup_limit = Semaphore(MAX_CONCURRENT_DEVICE_SETUPS)
+
+    async def _async_limited[T](setup: Callable[[], Awaitable[T]]) -> T:
+        """Run a device setup while bounding concurrent connections and refreshes.
+
+        The setup coroutine is only created once a slot is free, so setups that
+        never get one (cancellation or an early failure) leave nothing unawaited.
+        """
+        async with setup_limit:
+            return await setup()
+
     if has_cloud_account and account and password and use_wifi:
         cloud_available = await _async_attempt_login(
             hass,
@@ -436,225 +708,79 @@ async def async_setup_entry(hass: HomeAssistant, entry: MammotionConfigEntry) ->
             mammotion
         )
 
-        for device in mower_devices:
-            if device_ble_address := addresses.get(device.device_name, None):
-                await _attach_ble_to_mower(
-                    hass,
-                    entry,
-                    mammotion,
-                    device,
-                    device_ble_address,
-                )
-
-            if not use_wifi:
-                mammotion.set_prefer_ble(device.device_name, prefer_ble=True)
-                handle = mammotion.mower(device.device_name)
-                if handle is not None:
-                    for t_type in (
-                        TransportType.CLOUD_ALIYUN,
-                        TransportType.CLOUD_MAMMOTION,
-                    ):
-                        await handle.disconnect_transport(t_type)
-            elif prefer_ble:
-                mammotion.set_prefer_ble(device.device_name, prefer_ble=True)
-
-            mammotion.set_mow_path_fetch_enabled(
-                device.device_name, enabled=mow_path_fetch_enabled
-            )
-
-            unique_name = device.device_name
-
-            maintenance_coordinator = MammotionMaintenanceUpdateCoordinator(
-                hass, entry, device, mammotion, unique_name=unique_name
-            )
-            version_coordinator = MammotionDeviceVersionUpdateCoordinator(
-                hass, entry, device, mammotion, unique_name=unique_name
-            )
-            report_coordinator = MammotionReportUpdateCoordinator(
-                hass, entry, device, mammotion, unique_name=unique_name
-            )
-            map_coordinator = MammotionMapUpdateCoordinator(
-                hass, entry, device, mammotion, unique_name=unique_name
-            )
-            error_coordinator = MammotionDeviceErrorUpdateCoordinator(
-                hass, entry, device, mammotion, unique_name=unique_name
-            )
-
-            await _await_device_connection(
-                mammotion,
-                device.device_name,
-                prefer_ble=(not use_wifi or prefer_ble),
-            )
-
-            await report_coordinator.async_restore_data()
-            await version_coordinator.async_config_entry_first_refresh()
-
-            await report_coordinator.async_config_entry_first_refresh()
-            await maintenance_coordinator.async_config_entry_first_refresh()
-
-            await error_coordinator.async_config_entry_first_refresh()
-            await map_coordinator._async_setup()
-
-            mammotion_mowers.append(
-                MammotionMowerData(
-                    name=device.device_name,
-                    unique_name=unique_name,
-                    device=device,
-                    api=mammotion,
-                    maintenance_coordinator=maintenance_coordinator,
-                    reporting_coordinator=report_coordinator,
-                    version_coordinator=version_coordinator,
-                    map_coordinator=map_coordinator,
-                    error_coordinator=error_coordinator,
-                )
-            )
-
-            async def _async_refresh_map(_: datetime) -> None:
-                """Call the debouncer at a later time."""
-                await map_coordinator.async_request_refresh()
-
-            async_call_later(
-                hass,
-                1,
-                HassJob(
-                    _async_refresh_map,
-                    "map-coordinator-refresh",
-                    cancel_on_shutdown=True,
+        # Every device is set up concurrently and allowed to finish before the
+        # first failure is raised, so one slow or broken device neither delays
+        # nor orphans the others.
+        mower_results, rtk_results, spino_results = await gather(
+            gather(
+                *(
+                    _async_limited(
+                        partial(
+                            _async_setup_mower,
+                            hass,
+                            entry,
+                            mammotion,
+                            device,
+                            addresses.get(device.device_name),
+                            use_wifi=use_wifi,
+                            prefer_ble=prefer_ble,
+                            mow_path_fetch_enabled=mow_path_fetch_enabled,
+                        )
+                    )
+                    for device in mower_devices
                 ),
-            )
-
-        for rtk in mammotion_rtk_devices:
-            if rtk_ble_address := addresses.get(rtk.device_name, None):
-                await _attach_ble_to_rtk(
-                    hass,
-                    entry,
-                    mammotion,
-                    rtk,
-                    rtk_ble_address,
-                )
-
-            rtk_unique_name = rtk.device_name
-            rtk_coordinator = MammotionRTKCoordinator(
-                hass, entry, rtk, mammotion, unique_name=rtk_unique_name
-            )
-            await rtk_coordinator.async_restore_data()
-            await rtk_coordinator.async_config_entry_first_refresh()
-            mammotion_rtk.append(
-                MammotionRTKData(
-                    name=rtk.device_name,
-                    unique_name=rtk_unique_name,
-                    api=mammotion,
-                    device=rtk,
-                    coordinator=rtk_coordinator,
-                )
-            )
-
-        for spino in spino_devices:
-            spino_unique_name = spino.device_name
-            spino_coordinator = MammotionSpinoCoordinator(
-                hass, entry, spino, mammotion, unique_name=spino_unique_name
-            )
-            await spino_coordinator.async_restore_data()
-            await spino_coordinator.async_config_entry_first_refresh()
-            mammotion_spino.append(
-                MammotionSpinoData(
-                    name=spino.device_name,
-                    unique_name=spino_unique_name,
-                    api=mammotion,
-                    device=spino,
-                    coordinator=spino_coordinator,
-                )
-            )
+                return_exceptions=True,
+            ),
+            gather(
+                *(
+                    _async_limited(
+                        partial(
+                            _async_setup_rtk,
+                            hass,
+                            entry,
+                            mammotion,
+                            rtk,
+                            addresses.get(rtk.device_name),
+                        )
+                    )
+                    for rtk in mammotion_rtk_devices
+                ),
+                return_exceptions=True,
+            ),
+            gather(
+                *(
+                    _async_limited(
+                        partial(_async_setup_spino, hass, entry, mammotion, spino)
+                    )
+                    for spino in spino_devices
+                ),
+                return_exceptions=True,
+            ),
+        )
+        mammotion_mowers.extend(_unwrap_setup_results(mower_results))
+        mammotion_rtk.extend(_unwrap_setup_results(rtk_results))
+        mammotion_spino.extend(_unwrap_setup_results(spino_results))
 
     elif addresses and not cloud_available:
         # BLE-only mode: either the user set use_wifi=False, has no account, or
         # cloud login failed and we are falling back to BLE for each known device.
-        for device_name, ble_address in addresses.items():
-            ble_device = bluetooth.async_ble_device_from_address(
-                hass, ble_address.upper(), True
-            )
-
-            # Register the device regardless of whether it is currently in range.
-            # If ble_device is None the transport is created with just the address;
-            # _register_ble_reconnect_callback will push the BLEDevice when the
-            # device is first seen.  Raising ConfigEntryNotReady here retries the
-            # ENTIRE entry, orphaning any already-registered devices and their
-            # active BLE connections.
-            if ble_device is not None:
-                await mammotion.add_ble_only_device(
-                    device_id=device_name,
-                    device_name=device_name,
-                    ble_device=ble_device,
-                    initial_device=MowingDevice(name=device_name),
-                )
-            else:
-                LOGGER.info(
-                    "BLE device %s (%s) not in range at startup — registering and waiting",
-                    device_name,
-                    ble_address,
-                )
-                await mammotion.add_ble_only_device(
-                    device_id=device_name,
-                    device_name=device_name,
-                    ble_address=ble_address,
-                    initial_device=MowingDevice(name=device_name),
-                )
-
-            _register_ble_reconnect_callback(
-                hass, entry, mammotion, device_name, ble_address
-            )
-
-            synthetic_device = _create_ble_only_device(device_name)
-            unique_name = device_name
-
-            maintenance_coordinator = MammotionMaintenanceUpdateCoordinator(
-                hass, entry, synthetic_device, mammotion, unique_name=unique_name
-            )
-            version_coordinator = MammotionDeviceVersionUpdateCoordinator(
-                hass, entry, synthetic_device, mammotion, unique_name=unique_name
-            )
-            report_coordinator = MammotionReportUpdateCoordinator(
-                hass, entry, synthetic_device, mammotion, unique_name=unique_name
-            )
-            map_coordinator = MammotionMapUpdateCoordinator(
-                hass, entry, synthetic_device, mammotion, unique_name=unique_name
-            )
-            error_coordinator = MammotionDeviceErrorUpdateCoordinator(
-                hass, entry, synthetic_device, mammotion, unique_name=unique_name
-            )
-
-            await report_coordinator.async_restore_data()
-            if ble_device is not None:
-                # In range — connect BLE and wait until it's up (30s cap) before
-                # the coordinators start polling.
-                await _await_device_connection(mammotion, device_name, prefer_ble=True)
-                await version_coordinator.async_config_entry_first_refresh()
-                await report_coordinator.async_config_entry_first_refresh()
-                await maintenance_coordinator.async_config_entry_first_refresh()
-                await error_coordinator.async_config_entry_first_refresh()
-            else:
-                # Device not in range — do a best-effort refresh that won't raise
-                # ConfigEntryNotReady.  Coordinators will retry on their normal
-                # schedule; entities show unavailable until the device connects.
-                await version_coordinator.async_refresh()
-                await report_coordinator.async_refresh()
-                await maintenance_coordinator.async_refresh()
-                await error_coordinator.async_refresh()
-            await map_coordinator._async_setup()
-
-            mammotion_mowers.append(
-                MammotionMowerData(
-                    name=device_name,
-                    unique_name=unique_name,
-                    device=synthetic_device,
-                    api=mammotion,
-                    maintenance_coordinator=maintenance_coordinator,
-                    reporting_coordinator=report_coordinator,
-                    version_coordinator=version_coordinator,
-                    map_coordinator=map_coordinator,
-                    error_coordinator=error_coordinator,
+        mower_results = await gather(
+            *(
+                _async_limited(
+                    partial(
+                        _async_setup_ble_only_mower,
+                        hass,
+                        entry,
+                        mammotion,
+                        device_name,
+                        ble_address,
+                    )
                 )
-            )
+                for device_name, ble_address in addresses.items()
+            ),
+            return_exceptions=True,
+        )
+        mammotion_mowers.extend(_unwrap_setup_results(mower_results))
 
     mammotion_devices.RTK = mammotion_rtk
     mammotion_devices.mowers = mammotion_mowers
@@ -736,10 +862,7 @@ def store_cloud_credentials(
     if not cache:
         return
     translated = {_LIBRARY_TO_HA_KEY.get(k, k): v for k, v in cache.items()}
-    hass.config_entries.async_update_entry(
-        config_entry,
-        data={**config_entry.data, **translated},
-    )
+    async_update_entry_data_if_changed(hass, config_entry, translated)
 
 
 def _load_cached_credentials(entry: MammotionConfigEntry) -> dict[str, Any]:
@@ -749,12 +872,13 @@ def _load_cached_credentials(entry: MammotionConfigEntry) -> dict[str, Any]:
     keys are present and non-None, otherwise returns an empty dict so the
     caller knows to fall back to a full login.
     """
-    library_data = {_HA_TO_LIBRARY_KEY.get(k, k): v for k, v in entry.data.items()}
-    has_aliyun = bool(library_data.get("aep_data"))
-    has_mammotion = bool(library_data.get("mammotion_mqtt")) and bool(
-        library_data.get("mammotion_device_records")
-    )
-    return library_data if (has_aliyun or has_mammotion) else {}
+    data = entry.data
+    if not (
+        data.get(CONF_AEP_DATA)
+        or (data.get(CONF_MAMMOTION_MQTT) and data.get(CONF_MAMMOTION_DEVICE_RECORDS))
+    ):
+        return {}
+    return {_HA_TO_LIBRARY_KEY.get(k, k): v for k, v in data.items()}
 
 
 async def _async_update_listener(
@@ -764,20 +888,32 @@ async def _async_update_listener(
     await hass.config_entries.async_reload(entry.entry_id)
 
 
+async def _async_unload_mower(mower: MammotionMowerData) -> None:
+    """Stop a mower and remove it from the client."""
+    try:
+        if handle := mower.api.mower(mower.name):
+            await handle.stop()
+        mower.api.teardown_device_watchers(mower.name)
+        await mower.api.remove_device(mower.name)
+    except TimeoutError:
+        """Do nothing as this sometimes occurs with disconnecting BLE."""
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: MammotionConfigEntry) -> bool:
     """Unload a config entry."""
 
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         if entry.runtime_data.mowers:
             store_cloud_credentials(hass, entry, entry.runtime_data.mowers[0].api)
-        for mower in entry.runtime_data.mowers:
-            try:
-                if handle := mower.api.mower(mower.name):
-                    await handle.stop()
-                mower.api.teardown_device_watchers(mower.name)
-                await mower.api.remove_device(mower.name)
-            except TimeoutError:
-                """Do nothing as this sometimes occurs with disconnecting BLE."""
+        # Devices are torn down concurrently so one slow BLE disconnect does
+        # not hold up the others.
+        results = await gather(
+            *(_async_unload_mower(mower) for mower in entry.runtime_data.mowers),
+            return_exceptions=True,
+        )
+        for mower, result in zip(entry.runtime_data.mowers, results, strict=True):
+            if isinstance(result, BaseException):
+                LOGGER.error("Error unloading %s", mower.name, exc_info=result)
     return bool(unload_ok)
 
 
@@ -801,13 +937,10 @@ async def async_remove_config_entry_device(
         ),
         None,
     )
-    mower = next(
-        (
-            mower
-            for mower in config_entry.runtime_data.mowers
-            if mower.unique_name == device_identifier
-        ),
-        None,
-    )
+    if device_identifier is None:
+        return True
 
-    return not bool(mower)
+    return not any(
+        mower.unique_name == device_identifier
+        for mower in config_entry.runtime_data.mowers
+    )
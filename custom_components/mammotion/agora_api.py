@@ -8,19 +8,25 @@ The implementation is based on analysis of the Agora JavaScript SDK (agoraRTC_N.
 to ensure compatibility and parity with client-side behavior.
 """
 
+import asyncio
 import hashlib
-import json
 import logging
 import time
-from dataclasses import dataclass
-from random import randint
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain, repeat
+from secrets import randbelow, randbits, token_hex
 from types import TracebackType
-from typing import Any, cast
+from typing import Any, Final, cast
 
 import aiohttp
+import orjson
+
+_LOGGER = logging.getLogger(__name__)
 
 # Service IDs for API requests (what you send in the request)
-SERVICE_IDS = {
+SERVICE_IDS: Final[dict[str, int]] = {
     "CHOOSE_SERVER": 11,  # Media gateway / WebSocket edge servers
     "CLOUD_PROXY": 18,
     "CLOUD_PROXY_5": 20,
@@ -28,7 +34,7 @@ SERVICE_IDS = {
 }
 
 # Response flags (what you receive in response_body[].buffer.flag)
-RESPONSE_FLAGS = {
+RESPONSE_FLAGS: Final[dict[str, int]] = {
     "CHOOSE_SERVER": 4096,  # Media gateway addresses
     "CLOUD_PROXY": 1048576,
     "CLOUD_PROXY_5": 4194304,
@@ -36,6 +42,40 @@ RESPONSE_FLAGS = {
 }
 
 
+# Failures that move discovery on to the next domain: network and HTTP errors,
+# timeouts and undecodable bodies. Anything else is a bug and propagates.
+_RETRYABLE_ERRORS: Final[tuple[type[Exception], ...]] = (
+    aiohttp.ClientError,
+    TimeoutError,
+    orjson.JSONDecodeError,
+)
+
+# Prebuilt multipart/form-data framing for the single "request" field that
+# carries the JSON payload, equivalent to the SDK's FormData upload
+_FORM_BOUNDARY: Final = token_hex(16)
+_FORM_HEADERS: Final = {
+    "Content-Type": f"multipart/form-data; boundary={_FORM_BOUNDARY}"
+}
+_FORM_PREFIX: Final = (
+    f"--{_FORM_BOUNDARY}\r\n"
+    'Content-Disposition: form-data; name="request"\r\n'
+    "Content-Type: application/json\r\n\r\n"
+).encode()
+_FORM_SUFFIX: Final = f"\r\n--{_FORM_BOUNDARY}--\r\n".encode()
+
+# ICE server URL templates enabled by each new_turn_mode
+_TURN_UDP = "turn:{ip}:3478?transport=udp"
+_TURN_TCP = "turn:{ip}:3478?transport=tcp"
+_TURN_TLS = "turns:{tls_host}:443?transport=tcp"
+_TURN_MODE_URL_TEMPLATES: Final[dict[int, tuple[str, ...]]] = {
+    1: (_TURN_UDP,),
+    2: (_TURN_TCP,),
+    3: (_TURN_TLS,),
+    4: (_TURN_UDP, _TURN_TCP, _TURN_TLS),
+}
+
+
+@lru_cache(maxsize=256)
 def derive_password(uid: int | str) -> str:
     """Derive TURN/STUN password using SHA-256 hash.
 
@@ -51,11 +91,11 @@ def derive_password(uid: int | str) -> str:
         Hexadecimal string representation of SHA-256 hash
 
     """
-    uid_str = str(uid)
-    return hashlib.sha256(uid_str.encode("utf-8")).hexdigest()
+    uid_bytes = b"%d" % uid if isinstance(uid, int) else uid.encode("utf-8")
+    return hashlib.sha256(uid_bytes).hexdigest()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EdgeAddress:
     """Represents an edge server address."""
 
@@ -65,6 +105,13 @@ class EdgeAddress:
     credentials: str | None = None
     ticket: str | None = None
     fingerprint: str | None = None
+    tls_host: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Derive the TLS hostname used for TURNS URLs."""
+        object.__setattr__(
+            self, "tls_host", f"{self.ip.replace('.', '-')}.edge.agora.io"
+        )
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -76,7 +123,7 @@ class EdgeAddress:
         return result
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ICEServer:
     """Represents an RTCIceServer configuration."""
 
@@ -94,7 +141,7 @@ class ICEServer:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class AgoraResponse:
     """Parsed response from Agora WebRTC API.
 
@@ -135,105 +182,136 @@ class AgoraResponse:
         if not response_body:
             raise ValueError("No response_body in API response")
 
-        _log = logging.getLogger(__name__)
-        _log.debug("Agora API response body count: %d", len(response_body))
-
-        # Parse all responses by flag
-        responses_by_flag = {}
-        first_buffer = None
-
-        for response_item in response_body:
-            buffer = response_item.get("buffer", {})
-            code = buffer.get("code", -1)
-
-            if code != 0:
-                raise Exception(f"Agora API returned error code: {code}")
-
-            flag = buffer.get("flag", 0)
-            ticket = buffer.get("cert", "")
-            edges_services = buffer.get("edges_services", [])
-            detail = {**detail, **buffer.get("detail", {})}
-            uid = buffer.get("uid", 0)
+        _LOGGER.debug("Agora API response body count: %d", len(response_body))
 
-            _log.info(
-                "Parsing response flag=%d, uid=%d, edges_count=%d",
-                flag,
-                uid,
-                len(edges_services),
-            )
+        responses_by_flag: dict[int, dict[str, Any]] = {}
 
-            # Note: We intentionally ignore the 'detail' fields for credentials (detail.8/detail.4)
-            # to match Agora SDK behavior which uses UID-derived credentials in secure contexts.
-            # Using detail fields causes TURN 401 failures because the server expects UID hash.
-            # The actual derivation happens below (lines 239-240).
-            # Parse fingerprints from detail[19] (semicolon-separated list)
-            # Each fingerprint corresponds to an edge address
-            fingerprints = []
-            if detail.get("19"):
-                fingerprint_str = detail["19"]
-                # Split by semicolon and strip whitespace
-                fingerprints = [
-                    fp.strip() for fp in fingerprint_str.split(";") if fp.strip()
-                ]
-
-            username = str(uid)
-            credentials = derive_password(uid)
-
-            addresses = [
-                EdgeAddress(
-                    ip=edge["ip"],
-                    port=edge["port"],
-                    username=username,
-                    credentials=credentials,
-                    ticket=ticket,
-                    fingerprint=fingerprints[i] if i < len(fingerprints) else None,
+        if len(response_body) == 1:
+            # Single service flag: nothing to merge or choose between
+            first_buffer = response_body[0].get("buffer", {})
+            first_parsed = first_response = cls._parse_buffer(first_buffer, detail, {})
+        else:
+            # Parse all responses by flag in a single pass; the first buffer
+            # supplies the primary response fields
+            edge_cache: dict[tuple[Any, ...], EdgeAddress] = {}
+            first_buffer = response_body[0].get("buffer", {})
+            first_parsed = cls._parse_buffer(first_buffer, detail, edge_cache)
+            detail = first_parsed["detail"]
+            responses_by_flag[first_parsed["flag"]] = first_parsed
+
+            for response_item in response_body[1:]:
+                parsed = cls._parse_buffer(
+                    response_item.get("buffer", {}), detail, edge_cache
                 )
-                for i, edge in enumerate(edges_services)
-            ]
-
-            # Store all responses with complete data
-            responses_by_flag[flag] = {
-                "code": code,
-                "addresses": addresses,
-                "ticket": ticket,
-                "uid": buffer.get("uid", 0),
-                "cid": buffer.get("cid", 0),
-                "cname": buffer.get("cname", ""),
-                "detail": detail,
-                "flag": flag,
-                "edges_services": edges_services,  # Preserve raw edges_services
-            }
-
-            # Use first response for primary fields
-            if first_buffer is None:
-                first_buffer = buffer
-
-        if first_buffer is None:
-            raise ValueError("No valid buffer in response_body")
+                detail = parsed["detail"]
+                responses_by_flag[parsed["flag"]] = parsed
 
-        # Get the first flag's response data (already parsed with addresses)
-        first_flag = first_buffer.get("flag", 0)
-        first_response = responses_by_flag.get(
-            4096, responses_by_flag.get(first_flag, {})
-        )
+            # Get the first flag's response data (already parsed with addresses)
+            first_response = responses_by_flag.get(
+                4096, responses_by_flag.get(first_parsed["flag"], {})
+            )
 
         # Create response with primary fields from first buffer
         return cls(
-            code=first_buffer.get("code", -1),
+            code=first_parsed["code"],
             addresses=first_response.get(
                 "addresses", []
             ),  # Use already-created addresses
-            ticket=first_buffer.get("cert", ""),
-            uid=first_buffer.get("uid", 0),
-            cid=first_buffer.get("cid", 0),
-            cname=first_buffer.get("cname", ""),
-            server_ts=response_data.get("enter_ts", int(time.time() * 1000)),
+            ticket=first_parsed["ticket"],
+            uid=first_parsed["uid"],
+            cid=first_parsed["cid"],
+            cname=first_parsed["cname"],
+            server_ts=response_data.get("enter_ts", time.time_ns() // 1_000_000),
             detail=first_buffer.get("detail", {}),
-            flag=first_flag,
+            flag=first_parsed["flag"],
             opid=response_data.get("opid", 0),
             responses=responses_by_flag if len(responses_by_flag) > 1 else None,
         )
 
+    @staticmethod
+    def _parse_buffer(
+        buffer: dict[str, Any],
+        detail: dict[str, Any],
+        edge_cache: dict[tuple[Any, ...], EdgeAddress],
+    ) -> dict[str, Any]:
+        """Parse a single response_body buffer into a per-flag response dict.
+
+        Args:
+            buffer: The buffer of one response_body item
+            detail: Detail fields accumulated from earlier items
+            edge_cache: EdgeAddress objects already built for this response
+
+        Returns:
+            Response dict for the buffer's flag, with detail merged in
+
+        """
+        code = buffer.get("code", -1)
+
+        if code != 0:
+            raise Exception(f"Agora API returned error code: {code}")
+
+        flag = buffer.get("flag", 0)
+        ticket = buffer.get("cert", "")
+        edges_services = buffer.get("edges_services", [])
+        if buffer_detail := buffer.get("detail"):
+            # Copy rather than update: each flag keeps its own detail snapshot
+            detail = {**detail, **buffer_detail}
+        uid = buffer.get("uid", 0)
+
+        _LOGGER.info(
+            "Parsing response flag=%d, uid=%d, edges_count=%d",
+            flag,
+            uid,
+            len(edges_services),
+        )
+
+        # Note: We intentionally ignore the 'detail' fields for credentials (detail.8/detail.4)
+        # to match Agora SDK behavior which uses UID-derived credentials in secure contexts.
+        # Using detail fields causes TURN 401 failures because the server expects UID hash.
+        # The actual derivation happens below.
+        # Parse fingerprints from detail[19] (semicolon-separated list)
+        # Each fingerprint corresponds to an edge address
+        fingerprints = []
+        if detail.get("19"):
+            fingerprint_str = detail["19"]
+            # Split by semicolon and strip whitespace
+            fingerprints = [
+                fp.strip() for fp in fingerprint_str.split(";") if fp.strip()
+            ]
+
+        username = str(uid)
+        credentials = derive_password(uid)
+
+        # Edges repeated across service flags share one EdgeAddress
+        addresses = []
+        for edge, fingerprint in zip(
+            edges_services, chain(fingerprints, repeat(None)), strict=False
+        ):
+            key = (edge["ip"], edge["port"], username, ticket, fingerprint)
+            if (address := edge_cache.get(key)) is None:
+                address = edge_cache[key] = EdgeAddress(
+                    ip=edge["ip"],
+                    port=edge["port"],
+                    username=username,
+                    credentials=credentials,
+                    ticket=ticket,
+                    fingerprint=fingerprint,
+                )
+            addresses.append(address)
+
+        # Store all responses with complete data
+        return {
+            "code": code,
+            "addresses": addresses,
+            "ticket": ticket,
+            "uid": buffer.get("uid", 0),
+            "cid": buffer.get("cid", 0),
+            "cname": buffer.get("cname", ""),
+            "detail": detail,
+            "flag": flag,
+            "edges_services": edges_services,  # Preserve raw edges_services
+        }
+
     def get_ice_servers(
         self, use_all_turn_servers: bool = True, new_turn_mode: int = 4
     ) -> list[ICEServer]:
@@ -247,8 +325,7 @@ class AgoraResponse:
             List of ICEServer objects ready for RTCPeerConnection
 
         """
-        _log = logging.getLogger(__name__)
-        ice_servers = []
+        ice_servers: list[ICEServer] = []
 
         # Get TURN addresses from flag 4194310
         turn_addresses = self.get_turn_addresses()
@@ -256,7 +333,7 @@ class AgoraResponse:
         if not turn_addresses:
             # Fallback to any available addresses
             turn_addresses = self.addresses
-            _log.warning(
+            _LOGGER.warning(
                 "No TURN addresses found with flag 4194310, using primary addresses"
             )
 
@@ -265,65 +342,50 @@ class AgoraResponse:
             turn_addresses if use_all_turn_servers else turn_addresses[:1]
         )
 
-        _log.info(
+        _LOGGER.info(
             "Creating ICE servers: use_all=%s, mode=%s, addr_count=%d",
             use_all_turn_servers,
             new_turn_mode,
             len(addresses_to_use),
         )
 
+        # Based on new_turn_mode (from agoraRTC_N.js:30764-30796)
+        url_templates = _TURN_MODE_URL_TEMPLATES.get(new_turn_mode, ())
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
         for addr in addresses_to_use:
-            _log.debug(
-                "Processing TURN address: ip=%s, port=%d, username=%s, cred_len=%s",
-                addr.ip,
-                addr.port,
-                addr.username,
-                len(addr.credentials) if addr.credentials else 0,
-            )
+            if debug_enabled:
+                _LOGGER.debug(
+                    "Processing TURN address: ip=%s, port=%d, username=%s, cred_len=%s",
+                    addr.ip,
+                    addr.port,
+                    addr.username,
+                    len(addr.credentials) if addr.credentials else 0,
+                )
 
             # VALIDATION: Check credentials are present before creating ICE servers
             if not addr.username:
-                _log.error(
+                _LOGGER.error(
                     "CRITICAL: TURN address %s:%d has empty username! This will cause 401 errors.",
                     addr.ip,
                     addr.port,
                 )
             if not addr.credentials:
-                _log.error(
+                _LOGGER.error(
                     "CRITICAL: TURN address %s:%d has empty credentials! This will cause 401 errors.",
                     addr.ip,
                     addr.port,
                 )
 
-            # Based on new_turn_mode (from agoraRTC_N.js:30764-30796)
-            if new_turn_mode in [1, 4]:  # UDP
-                ice_servers.append(
-                    ICEServer(
-                        urls=f"turn:{addr.ip}:3478?transport=udp",
-                        username=addr.username,
-                        credential=addr.credentials,
-                    )
-                )
-
-            if new_turn_mode in [2, 4]:  # TCP
-                ice_servers.append(
-                    ICEServer(
-                        urls=f"turn:{addr.ip}:3478?transport=tcp",
-                        username=addr.username,
-                        credential=addr.credentials,
-                    )
-                )
-
-            if new_turn_mode in [3, 4]:  # TLS
-                ice_servers.append(
-                    ICEServer(
-                        urls=f"turns:{addr.ip.replace('.', '-')}.edge.agora.io:443?transport=tcp",
-                        username=addr.username,
-                        credential=addr.credentials,
-                    )
+            ice_servers.extend(
+                ICEServer(
+                    urls=template.format(ip=addr.ip, tls_host=addr.tls_host),
+                    username=addr.username,
+                    credential=addr.credentials,
                 )
+                for template in url_templates
+            )
 
-        _log.info(
+        _LOGGER.info(
             "Created %d ICE server entries from %d addresses",
             len(ice_servers),
             len(addresses_to_use),
@@ -331,9 +393,9 @@ class AgoraResponse:
 
         # SUMMARY: Log all created ICE servers for validation
         if ice_servers:
-            _log.info("ICE Server Summary:")
+            _LOGGER.info("ICE Server Summary:")
             for i, server in enumerate(ice_servers):
-                _log.info(
+                _LOGGER.info(
                     "  [%d] urls=%s, username=%s, cred_present=%s",
                     i,
                     server.urls,
@@ -341,7 +403,7 @@ class AgoraResponse:
                     bool(server.credential),
                 )
         else:
-            _log.error(
+            _LOGGER.error(
                 "WARNING: No ICE servers were created! This will prevent TURN connections."
             )
 
@@ -375,24 +437,26 @@ class AgoraResponse:
 
         # Build 'servers' array from TURN addresses (flag 4194310)
         turn_addresses = self.get_turn_addresses()
-        for addr in turn_addresses:
-            config["servers"].append(
-                {
-                    "turnServerURL": addr.ip,
-                    "tcpport": addr.port,
-                    "udpport": addr.port,
-                    "username": str(self.uid),
-                    "password": derive_password(self.uid),
-                    "forceturn": False,
-                    "security": True,  # Always true for proxy fallback
-                }
-            )
+        username = str(self.uid)
+        password = derive_password(self.uid)
+        config["servers"] = [
+            {
+                "turnServerURL": addr.ip,
+                "tcpport": addr.port,
+                "udpport": addr.port,
+                "username": username,
+                "password": password,
+                "forceturn": False,
+                "security": True,  # Always true for proxy fallback
+            }
+            for addr in turn_addresses
+        ]
 
         # Build 'serversFromGateway' from connected gateway
         if use_gateway and gateway_address and token:
             config["serversFromGateway"].append(
                 {
-                    "username": str(self.uid),
+                    "username": username,
                     "password": token,  # Use JWT token, not hashed
                     "turnServerURL": gateway_address.ip,
                     "tcpport": gateway_address.port + 30,  # Gateway port + 30
@@ -512,6 +576,9 @@ class AgoraAPIClient:
         "webrtc2-ap-web-6.agora.io",
     ]
 
+    # Seconds to wait on in-flight requests before also trying the next domain
+    HEDGE_DELAY = 0.5
+
     def __init__(self, session: aiohttp.ClientSession | None = None):
         """Initialize Agora API client.
 
@@ -580,7 +647,7 @@ class AgoraAPIClient:
             service_flags = [11, 26]
 
         if sid is None:
-            sid = str(randint(0, 2**31 - 1))
+            sid = str(randbits(31))
 
         # Build request payload
         request_payload = self._build_request_payload(
@@ -595,8 +662,7 @@ class AgoraAPIClient:
             sid=sid,
             uri=22,  # Choose server operation
         )
-        _log = logging.getLogger(__name__)
-        _log.debug("Agora choose_server request payload: %s", request_payload)
+        _LOGGER.debug("Agora choose_server request payload: %s", request_payload)
         # Make API call
         response = await self._make_api_call(request_payload, proxy_server=proxy_server)
 
@@ -648,7 +714,7 @@ class AgoraAPIClient:
             edge_addresses = []
 
         if sid is None:
-            sid = str(randint(0, 2**31 - 1))
+            sid = str(randbits(31))
 
         # Build request payload
         request_payload = self._build_request_payload(
@@ -663,8 +729,7 @@ class AgoraAPIClient:
             uri=28,  # Ticket update operation
         )
 
-        _log = logging.getLogger(__name__)
-        _log.debug("Agora update_ticket request payload: %s", request_payload)
+        _LOGGER.debug("Agora update_ticket request payload: %s", request_payload)
 
         # Make API call
         response = await self._make_api_call(request_payload, proxy_server=proxy_server)
@@ -728,23 +793,22 @@ class AgoraAPIClient:
             Properly formatted request payload
 
         """
-        client_ts = int(time.time() * 1000)
-        opid = randint(0, 10**12 - 1)
+        client_ts = time.time_ns() // 1_000_000
+        opid = randbelow(10**12)
         ap_rtm = None
         # Build detail field - matches JavaScript SDK pattern
         # mF(mF(mF({ 6: stringUid, 11: t, 12: USE_NEW_TOKEN ? "1" : undefined },
         #           r ? { 17: r } : {}), {}, { 22: t }, ...)
         # if use new token add "12": "1"
         # "6": string_uid,
-        detail = self.merge_objects(
-            {"11": area_code},
-            {"17": str(role)} if role else {},
-            {"22": area_code},
-            {"26": "RTM2"} if ap_rtm else {},
-        )
-
-        _log = logging.getLogger(__name__)
-        _log.debug("Built detail field for request: %s", detail)
+        detail = {"11": area_code}
+        if role:
+            detail["17"] = str(role)
+        detail["22"] = area_code
+        if ap_rtm:
+            detail["26"] = "RTM2"
+
+        _LOGGER.debug("Built detail field for request: %s", detail)
         # Build buffer
         buffer = {
             "cname": channel_name,
@@ -797,31 +861,75 @@ class AgoraAPIClient:
             should_close = True
 
         try:
-            # Try primary servers
-            for domain in self.WEBCS_DOMAIN:
-                try:
-                    response = await self._call_endpoint(
-                        session, domain, request_payload, proxy_server
-                    )
-                    return response
-                except (TimeoutError, aiohttp.ClientError, Exception):
-                    continue
-
-            # Fall back to backup servers
-            for domain in self.WEBCS_DOMAIN_BACKUP:
-                try:
-                    response = await self._call_endpoint(
-                        session, domain, request_payload, proxy_server
-                    )
-                    return response
-                except (TimeoutError, aiohttp.ClientError, Exception):
-                    continue
+            # Try primary servers, then fall back to backup servers
+            response = await self._hedged_call(
+                session,
+                chain(self.WEBCS_DOMAIN, self.WEBCS_DOMAIN_BACKUP),
+                request_payload,
+                proxy_server,
+            )
+        finally:
+            if should_close:
+                await session.close()
 
+        if response is None:
             raise Exception("All Agora API servers failed to respond")
+        return response
+
+    async def _hedged_call(
+        self,
+        session: aiohttp.ClientSession,
+        domains: Iterable[str],
+        request_payload: dict[str, Any],
+        proxy_server: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Query domains in order, hedging slow ones, and return the first success.
+
+        The next domain is started as soon as an in-flight request fails with
+        a network, HTTP or JSON decoding error, or after HEDGE_DELAY seconds
+        without any response. The first successful response wins and the
+        remaining requests are cancelled.
+
+        Args:
+            session: aiohttp session
+            domains: Server domains in order of preference
+            request_payload: Request payload
+            proxy_server: Optional proxy URL
+
+        Returns:
+            Parsed JSON response, or None if every domain failed
 
+        """
+        remaining = iter(domains)
+        next_domain = next(remaining, None)
+        pending: set[asyncio.Task[dict[str, Any]]] = set()
+        try:
+            while next_domain is not None or pending:
+                if next_domain is not None:
+                    pending.add(
+                        asyncio.create_task(
+                            self._call_endpoint(
+                                session, next_domain, request_payload, proxy_server
+                            )
+                        )
+                    )
+                    next_domain = next(remaining, None)
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=self.HEDGE_DELAY if next_domain is not None else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    if (err := task.exception()) is None:
+                        return task.result()
+                    if not isinstance(err, _RETRYABLE_ERRORS):
+                        raise err
+                    _LOGGER.debug("Agora API request failed: %s", err)
         finally:
-            if should_close:
-                await session.close()
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        return None
 
     async def _call_endpoint(
         self,
@@ -847,20 +955,23 @@ class AgoraAPIClient:
         if proxy_server:
             url = f"https://{proxy_server}/ap/?url={domain}/api/v2/transpond/webrtc?v=2"
 
-        # Create FormData with JSON payload
-        form_data = aiohttp.FormData()
-        form_data.add_field(
-            "request", json.dumps(request_payload), content_type="application/json"
-        )
+        # Single-field multipart body with the JSON payload
+        body = _FORM_PREFIX + orjson.dumps(request_payload) + _FORM_SUFFIX
 
         async with session.post(
             url,
-            data=form_data,
+            data=body,
+            headers=_FORM_HEADERS,
             timeout=aiohttp.ClientTimeout(total=10),
             ssl=False,  # Note: In production, verify SSL certificates
         ) as resp:
             if resp.status != 200:
-                raise Exception(f"HTTP {resp.status}: {await resp.text()}")
+                raise aiohttp.ClientResponseError(
+                    resp.request_info,
+                    resp.history,
+                    status=resp.status,
+                    message=await resp.text(),
+                )
 
-            response_data = await resp.json()
+            response_data = orjson.loads(await resp.read())
             return cast(dict[str, Any], response_data)
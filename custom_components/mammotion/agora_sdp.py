@@ -1,10 +1,117 @@
 """Agora SDP manipulation logic mimicking agoraRTC_N.js."""
 
 import logging
+from collections.abc import Callable
 from typing import Any
 
 _LOGGER = logging.getLogger(__name__)
 
+# SDPParser ``a=`` line handler: (target section, attribute value, session dict).
+type _AttrHandler = Callable[[dict[str, Any], Any, dict[str, Any]], None]
+
+
+def _attr_setter(key: str) -> _AttrHandler:
+    """Return a handler that stores the attribute value under ``key``."""
+
+    def _set(target: dict[str, Any], val: Any, parsed: dict[str, Any]) -> None:
+        target[key] = val
+
+    return _set
+
+
+def _parse_fingerprint(
+    target: dict[str, Any], val: Any, parsed: dict[str, Any]
+) -> None:
+    """Handle ``a=fingerprint``."""
+    fparts = val.split()
+    fp_obj = {"hash": fparts[0], "fingerprint": fparts[1]}
+    target["fingerprints"] = target.get("fingerprints", [])
+    target["fingerprints"].append(fp_obj)
+    # Keep backward compatibility for 'fingerprint' key if needed by other code?
+    # But parse_offer_to_ortc should use fingerprints list.
+    target["fingerprint"] = fp_obj
+
+
+def _parse_rtpmap(target: dict[str, Any], val: Any, parsed: dict[str, Any]) -> None:
+    """Handle ``a=rtpmap``."""
+    rparts = val.split(None, 1)
+    pt = int(rparts[0])
+    rmap = rparts[1].split("/")
+    target["rtp"].append(
+        {
+            "payload": pt,
+            "codec": rmap[0],
+            "rate": int(rmap[1]) if len(rmap) > 1 else 90000,
+            "encoding": rmap[2] if len(rmap) > 2 else None,
+        }
+    )
+
+
+def _parse_fmtp(target: dict[str, Any], val: Any, parsed: dict[str, Any]) -> None:
+    """Handle ``a=fmtp``."""
+    fparts = val.split(None, 1)
+    target["fmtp"].append({"payload": int(fparts[0]), "config": fparts[1]})
+
+
+def _parse_rtcp_fb(target: dict[str, Any], val: Any, parsed: dict[str, Any]) -> None:
+    """Handle ``a=rtcp-fb``."""
+    fbparts = val.split()
+    target["rtcpFb"].append(
+        {
+            "payload": int(fbparts[0]),
+            "type": fbparts[1],
+            "subtype": " ".join(fbparts[2:]) if len(fbparts) > 2 else None,
+        }
+    )
+
+
+def _parse_extmap(target: dict[str, Any], val: Any, parsed: dict[str, Any]) -> None:
+    """Handle ``a=extmap``."""
+    eparts = val.split()
+    # RFC 5285: value may carry an optional /direction suffix (e.g. "2/recvonly")
+    ext_id = int(eparts[0].split("/")[0])
+    ext_dir = eparts[0].split("/")[1] if "/" in eparts[0] else None
+    entry: dict[str, Any] = {"value": ext_id, "uri": eparts[1]}
+    if ext_dir:
+        entry["direction"] = ext_dir
+    target["ext"].append(entry)
+
+
+def _parse_group(target: dict[str, Any], val: Any, parsed: dict[str, Any]) -> None:
+    """Handle ``a=group``; always recorded at session level."""
+    if "groups" not in parsed:
+        parsed["groups"] = []
+    gparts = val.split()
+    parsed["groups"].append({"type": gparts[0], "mids": " ".join(gparts[1:])})
+
+
+def _parse_msid_semantic(
+    target: dict[str, Any], val: Any, parsed: dict[str, Any]
+) -> None:
+    """Handle ``a=msid-semantic``; always recorded at session level."""
+    parsed["msidSemantic"] = {
+        "semantic": val.split()[0],
+        "token": val.split()[1] if len(val.split()) > 1 else "",
+    }
+
+
+# ``a=`` attribute name -> handler.  Attributes not listed here are ignored.
+_ATTR_HANDLERS: dict[str, _AttrHandler] = {
+    "ice-ufrag": _attr_setter("iceUfrag"),
+    "ice-pwd": _attr_setter("icePwd"),
+    "fingerprint": _parse_fingerprint,
+    "setup": _attr_setter("setup"),
+    "mid": _attr_setter("mid"),
+    "direction": _attr_setter("direction"),
+    "ice-options": _attr_setter("iceOptions"),
+    "rtpmap": _parse_rtpmap,
+    "fmtp": _parse_fmtp,
+    "rtcp-fb": _parse_rtcp_fb,
+    "extmap": _parse_extmap,
+    "group": _parse_group,
+    "msid-semantic": _parse_msid_semantic,
+}
+
 
 class SDPParser:
     """Basic SDP parser to avoid external dependencies, matching Agora JS behavior."""
@@ -62,75 +169,9 @@ class SDPParser:
 
                 target = current_media if current_media else parsed
 
-                if attr == "ice-ufrag":
-                    target["iceUfrag"] = val
-                elif attr == "ice-pwd":
-                    target["icePwd"] = val
-                elif attr == "fingerprint":
-                    fparts = val.split()
-                    fp_obj = {"hash": fparts[0], "fingerprint": fparts[1]}
-                    target["fingerprints"] = target.get("fingerprints", [])
-                    target["fingerprints"].append(fp_obj)
-                    # Keep backward compatibility for 'fingerprint' key if needed by other code?
-                    # But parse_offer_to_ortc should use fingerprints list.
-                    target["fingerprint"] = fp_obj
-                elif attr == "setup":
-                    target["setup"] = val
-                elif attr == "mid":
-                    target["mid"] = val
-                elif attr == "direction":
-                    target["direction"] = val
-                elif attr == "ice-options":
-                    target["iceOptions"] = val
-                elif attr == "rtpmap":
-                    rparts = val.split(None, 1)
-                    pt = int(rparts[0])
-                    rmap = rparts[1].split("/")
-                    target["rtp"].append(
-                        {
-                            "payload": pt,
-                            "codec": rmap[0],
-                            "rate": int(rmap[1]) if len(rmap) > 1 else 90000,
-                            "encoding": rmap[2] if len(rmap) > 2 else None,
-                        }
-                    )
-                elif attr == "fmtp":
-                    fparts = val.split(None, 1)
-                    target["fmtp"].append(
-                        {"payload": int(fparts[0]), "config": fparts[1]}
-                    )
-                elif attr == "rtcp-fb":
-                    fbparts = val.split()
-                    target["rtcpFb"].append(
-                        {
-                            "payload": int(fbparts[0]),
-                            "type": fbparts[1],
-                            "subtype": " ".join(fbparts[2:])
-                            if len(fbparts) > 2
-                            else None,
-                        }
-                    )
-                elif attr == "extmap":
-                    eparts = val.split()
-                    # RFC 5285: value may carry an optional /direction suffix (e.g. "2/recvonly")
-                    ext_id = int(eparts[0].split("/")[0])
-                    ext_dir = eparts[0].split("/")[1] if "/" in eparts[0] else None
-                    entry: dict[str, Any] = {"value": ext_id, "uri": eparts[1]}
-                    if ext_dir:
-                        entry["direction"] = ext_dir
-                    target["ext"].append(entry)
-                elif attr == "group":
-                    if "groups" not in parsed:
-                        parsed["groups"] = []
-                    gparts = val.split()
-                    parsed["groups"].append(
-                        {"type": gparts[0], "mids": " ".join(gparts[1:])}
-                    )
-                elif attr == "msid-semantic":
-                    parsed["msidSemantic"] = {
-                        "semantic": val.split()[0],
-                        "token": val.split()[1] if len(val.split()) > 1 else "",
-                    }
+                handler = _ATTR_HANDLERS.get(attr)
+                if handler is not None:
+                    handler(target, val, parsed)
         return parsed
 
     @staticmethod
@@ -283,6 +324,15 @@ def parse_offer_to_ortc(offer_sdp: str) -> dict[str, Any]:
         mtype = m.get("type")
         codecs = []
 
+        # Group rtcp-fb and fmtp lines by payload type once per media section
+        # so each codec resolves its lines with a dict lookup, not a rescan.
+        fbs_by_pt: dict[Any, list[dict[str, Any]]] = {}
+        for fb in m.get("rtcpFb", []):
+            fbs_by_pt.setdefault(fb.get("payload"), []).append(fb)
+        fmtps_by_pt: dict[Any, list[dict[str, Any]]] = {}
+        for f in m.get("fmtp", []):
+            fmtps_by_pt.setdefault(f.get("payload"), []).append(f)
+
         # Parse codecs
         for rtp in m.get("rtp", []):
             pt = rtp.get("payload")
@@ -299,28 +349,26 @@ def parse_offer_to_ortc(offer_sdp: str) -> dict[str, Any]:
                 codec["rtpMap"]["encodingParameters"] = int(rtp.get("encoding"))
 
             # Feedbacks
-            for fb in m.get("rtcpFb", []):
-                if fb.get("payload") == pt:
-                    fb_obj = {"type": fb.get("type")}
-                    if fb.get("subtype"):
-                        fb_obj["parameter"] = fb.get("subtype")
-                    codec["rtcpFeedbacks"].append(fb_obj)
+            for fb in fbs_by_pt.get(pt, ()):
+                fb_obj = {"type": fb.get("type")}
+                if fb.get("subtype"):
+                    fb_obj["parameter"] = fb.get("subtype")
+                codec["rtcpFeedbacks"].append(fb_obj)
 
             # Add forced rrtr if missing
             if not any(fb["type"] == "rrtr" for fb in codec["rtcpFeedbacks"]):
                 codec["rtcpFeedbacks"].append({"type": "rrtr"})
 
             # FMTP
-            for f in m.get("fmtp", []):
-                if f.get("payload") == pt:
-                    for part in f.get("config", "").split(";"):
-                        if "=" in part:
-                            k, v = part.split("=", 1)
-                            codec["fmtp"]["parameters"][k.strip()] = v.strip()
-                        elif part.strip():
-                            # Handle flags or key-only params if any (less common in fmtp but possible)
-                            # JS logic: params[k.trim()] = v ? v.trim() : null;
-                            codec["fmtp"]["parameters"][part.strip()] = None
+            for f in fmtps_by_pt.get(pt, ()):
+                for part in f.get("config", "").split(";"):
+                    if "=" in part:
+                        k, v = part.split("=", 1)
+                        codec["fmtp"]["parameters"][k.strip()] = v.strip()
+                    elif part.strip():
+                        # Handle flags or key-only params if any (less common in fmtp but possible)
+                        # JS logic: params[k.trim()] = v ? v.trim() : null;
+                        codec["fmtp"]["parameters"][part.strip()] = None
             codecs.append(codec)
 
         # Parse extensions
@@ -10,9 +10,10 @@ import secrets
 import ssl
 import time
 import uuid
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Mapping
 from dataclasses import dataclass
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Final
 
 import aiohttp
 from homeassistant.core import HomeAssistant
@@ -49,6 +50,27 @@ RENEW_TOKEN_DEBOUNCE_SECS: float = 30.0
 #: every 3 s (the app's ``FPV4GVideoStateMannager.refreshInterval = 3000ms``).
 FPV_KEEPALIVE_INTERVAL_SECS: float = 3.0
 
+#: Default RTCP feedback applied to offer codecs that advertise none.  The
+#: templates are read-only; each codec entry gets its own dict copies.
+_RRTR_FEEDBACK: Final[Mapping[str, str]] = MappingProxyType({"type": "rrtr"})
+_TRANSPORT_CC_FEEDBACK: Final[Mapping[str, str]] = MappingProxyType(
+    {"type": "transport-cc"}
+)
+_RRTR_RTCP_FB: Final[tuple[Mapping[str, str], ...]] = (_RRTR_FEEDBACK,)
+_OPUS_RTCP_FB: Final[tuple[Mapping[str, str], ...]] = (
+    _RRTR_FEEDBACK,
+    _TRANSPORT_CC_FEEDBACK,
+)
+_VIDEO_RTCP_FB: Final[tuple[Mapping[str, str], ...]] = (
+    MappingProxyType({"type": "goog-remb"}),
+    _TRANSPORT_CC_FEEDBACK,
+    MappingProxyType({"type": "ccm", "parameter": "fir"}),
+    MappingProxyType({"type": "nack"}),
+    MappingProxyType({"type": "nack", "parameter": "pli"}),
+    _RRTR_FEEDBACK,
+)
+_VIDEO_RTCP_FB_CODECS = frozenset({"VP8", "VP9", "H264", "AV1"})
+
 
 @dataclass
 class AddressEntry:
@@ -1176,6 +1198,15 @@ class AgoraWebSocketHandler:
                 elif media_type == "video":
                     video_direction = dir_val
 
+                # Index fmtp and rtcp-fb lines by payload type once per media
+                # section rather than rescanning both lists for every codec.
+                fmtp_by_pt: dict[Any, dict[str, Any]] = {}
+                for fmtp in media.get("fmtp", []):
+                    fmtp_by_pt.setdefault(fmtp["payload"], fmtp)
+                rtcp_fb_by_pt: dict[Any, list[dict[str, Any]]] = {}
+                for rtcp_fb in media.get("rtcpFb", []):
+                    rtcp_fb_by_pt.setdefault(rtcp_fb.get("payload"), []).append(rtcp_fb)
+
                 # Process RTP codecs
                 for rtp in media.get("rtp", []):
                     codec_entry = {
@@ -1193,22 +1224,21 @@ class AgoraWebSocketHandler:
 
                     # Find fmtp parameters for this payload type
                     fmtp_params = {}
-                    for fmtp in media.get("fmtp", []):
-                        if fmtp["payload"] == rtp["payload"]:
-                            # Parse config string into parameters
-                            config = fmtp.get("config", "")
-                            if config:
-                                params = {}
-                                for param_pair in config.split(";"):
-                                    if "=" in param_pair:
-                                        key, value = param_pair.split("=", 1)
-                                        params[key.strip()] = value.strip()
-                                    else:
-                                        # Handle cases like "111/111" for RED codec
-                                        params[param_pair.strip()] = None
-                                if params:
-                                    fmtp_params = params
-                            break
+                    fmtp = fmtp_by_pt.get(rtp["payload"])
+                    if fmtp is not None:
+                        # Parse config string into parameters
+                        config = fmtp.get("config", "")
+                        if config:
+                            params = {}
+                            for param_pair in config.split(";"):
+                                if "=" in param_pair:
+                                    key, value = param_pair.split("=", 1)
+                                    params[key.strip()] = value.strip()
+                                else:
+                                    # Handle cases like "111/111" for RED codec
+                                    params[param_pair.strip()] = None
+                            if params:
+                                fmtp_params = params
 
                     # Add fmtp if found
                     if fmtp_params:
@@ -1216,34 +1246,25 @@ class AgoraWebSocketHandler:
 
                     # Process RTCP feedback from SDP
                     rtcp_feedbacks = []
-                    for rtcp_fb in media.get("rtcpFb", []):
-                        if rtcp_fb.get("payload") == rtp["payload"]:
-                            feedback = {"type": rtcp_fb["type"]}
-                            if "subtype" in rtcp_fb:
-                                feedback["parameter"] = rtcp_fb["subtype"]
-                            rtcp_feedbacks.append(feedback)
+                    for rtcp_fb in rtcp_fb_by_pt.get(rtp["payload"], ()):
+                        feedback = {"type": rtcp_fb["type"]}
+                        if "subtype" in rtcp_fb:
+                            feedback["parameter"] = rtcp_fb["subtype"]
+                        rtcp_feedbacks.append(feedback)
 
                     # Add default RTCP feedback based on media type and codec if none found
                     if not rtcp_feedbacks:
                         codec_name = rtp["codec"].upper()
                         if media_type == "video":
-                            if codec_name in ["VP8", "VP9", "H264", "AV1"]:
-                                rtcp_feedbacks = [
-                                    {"type": "goog-remb"},
-                                    {"type": "transport-cc"},
-                                    {"type": "ccm", "parameter": "fir"},
-                                    {"type": "nack"},
-                                    {"type": "nack", "parameter": "pli"},
-                                    {"type": "rrtr"},
-                                ]
-                            elif codec_name == "RTX":
-                                rtcp_feedbacks = [{"type": "rrtr"}]
+                            if codec_name in _VIDEO_RTCP_FB_CODECS:
+                                rtcp_feedbacks = [dict(fb) for fb in _VIDEO_RTCP_FB]
                             else:
-                                rtcp_feedbacks = [{"type": "rrtr"}]
+                                rtcp_feedbacks = [dict(fb) for fb in _RRTR_RTCP_FB]
                         elif media_type == "audio":
-                            rtcp_feedbacks = [{"type": "rrtr"}]
                             if codec_name == "OPUS":
-                                rtcp_feedbacks.append({"type": "transport-cc"})
+                                rtcp_feedbacks = [dict(fb) for fb in _OPUS_RTCP_FB]
+                            else:
+                                rtcp_feedbacks = [dict(fb) for fb in _RRTR_RTCP_FB]
 
                     codec_entry["rtcpFeedbacks"] = rtcp_feedbacks
 
@@ -1259,27 +1280,6 @@ class AgoraWebSocketHandler:
                         "extensionName": ext["uri"],
                     }
 
-                    # Map common extension names to match Agora's format
-                    uri_mappings = {
-                        "urn:ietf:params:rtp-hdrext:ssrc-audio-level": "urn:ietf:params:rtp-hdrext:ssrc-audio-level",
-                        "http://www.webrtc.org/experiments/rtp-hdrext/abs-send-time": "http://www.webrtc.org/experiments/rtp-hdrext/abs-send-time",
-                        "http://www.ietf.org/id/draft-holmer-rmcat-transport-wide-cc-extensions-01": "http://www.ietf.org/id/draft-holmer-rmcat-transport-wide-cc-extensions-01",
-                        "urn:ietf:params:rtp-hdrext:sdes:mid": "urn:ietf:params:rtp-hdrext:sdes:mid",
-                        "urn:ietf:params:rtp-hdrext:toffset": "urn:ietf:params:rtp-hdrext:toffset",
-                        "urn:3gpp:video-orientation": "urn:3gpp:video-orientation",
-                        "http://www.webrtc.org/experiments/rtp-hdrext/playout-delay": "http://www.webrtc.org/experiments/rtp-hdrext/playout-delay",
-                        "http://www.webrtc.org/experiments/rtp-hdrext/video-content-type": "http://www.webrtc.org/experiments/rtp-hdrext/video-content-type",
-                        "http://www.webrtc.org/experiments/rtp-hdrext/video-timing": "http://www.webrtc.org/experiments/rtp-hdrext/video-timing",
-                        "http://www.webrtc.org/experiments/rtp-hdrext/color-space": "http://www.webrtc.org/experiments/rtp-hdrext/color-space",
-                        "urn:ietf:params:rtp-hdrext:sdes:rtp-stream-id": "urn:ietf:params:rtp-hdrext:sdes:rtp-stream-id",
-                        "urn:ietf:params:rtp-hdrext:sdes:repaired-rtp-stream-id": "urn:ietf:params:rtp-hdrext:sdes:repaired-rtp-stream-id",
-                    }
-
-                    # Use mapped URI if available
-                    ext_entry["extensionName"] = uri_mappings.get(
-                        ext["uri"], ext["uri"]
-                    )
-
                     if media_type == "audio":
                         audio_extensions.append(ext_entry)
                     elif media_type == "video":
@@ -207,7 +207,7 @@ class MammotionConfigFlow(ConfigFlow, domain=DOMAIN):
             if account and password:
                 integration = await async_get_integration(self.hass, DOMAIN)
                 temp_client = MammotionClient(
-                    ha_version=integration.version.split("-")[0]
+                    ha_version=integration.version.partition("-")[0]
                 )
                 try:
                     session = aiohttp_client.async_get_clientsession(self.hass)
@@ -310,7 +310,7 @@ class MammotionConfigFlow(ConfigFlow, domain=DOMAIN):
             if account and password:
                 integration = await async_get_integration(self.hass, DOMAIN)
                 temp_client = MammotionClient(
-                    ha_version=integration.version.split("-")[0]
+                    ha_version=integration.version.partition("-")[0]
                 )
                 try:
                     session = aiohttp_client.async_get_clientsession(self.hass)
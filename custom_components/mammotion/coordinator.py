@@ -25,6 +25,7 @@ from homeassistant.components.bluetooth import (
 from homeassistant.const import CONF_PASSWORD
 from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
+from homeassistant.helpers import aiohttp_client
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.debounce import Debouncer
@@ -117,6 +118,23 @@ MAP_SYNC_STATUSES = ("synced", "syncing", "out_of_sync")
 DEVICE_NOT_RESPONDING_CODE = 50504
 
 
+@callback
+def async_update_entry_data_if_changed(
+    hass: HomeAssistant,
+    config_entry: MammotionConfigEntry,
+    updates: Mapping[str, Any],
+) -> None:
+    """Merge ``updates`` into the entry data, skipping the write if unchanged.
+
+    Credentials are re-persisted on every setup, refresh and unload; skip the
+    full entry.data copy (and the listener fan-out) when nothing has changed.
+    """
+    data = config_entry.data
+    if all(k in data and data[k] == v for k, v in updates.items()):
+        return
+    hass.config_entries.async_update_entry(config_entry, data={**data, **updates})
+
+
 class MammotionBaseUpdateCoordinator[DataT](DataUpdateCoordinator[DataT]):  # type: ignore[misc]
     """Mammotion DataUpdateCoordinator."""
 
@@ -233,7 +251,9 @@ class MammotionBaseUpdateCoordinator[DataT](DataUpdateCoordinator[DataT]):  # ty
                 # Get ICE servers from Agora API
                 try:
                     subscription = stream_data.data.to_dict()
-                    async with AgoraAPIClient() as agora_client:
+                    async with AgoraAPIClient(
+                        aiohttp_client.async_get_clientsession(self.hass)
+                    ) as agora_client:
                         agora_response = await agora_client.choose_server(
                             app_id=subscription["appid"],
                             token=subscription["token"],
@@ -502,9 +522,7 @@ class MammotionBaseUpdateCoordinator[DataT](DataUpdateCoordinator[DataT]):  # ty
                 (CONF_CONNECT_DATA if k == "connect_response" else k): v
                 for k, v in cache.items()
             }
-            self.hass.config_entries.async_update_entry(
-                config_entry, data={**config_entry.data, **translated}
-            )
+            async_update_entry_data_if_changed(self.hass, config_entry, translated)
 
     async def async_send_command(self, command: str, **kwargs: Any) -> bool | None:
         """Send command via MammotionClient command queue."""
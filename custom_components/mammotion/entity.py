@@ -25,6 +25,12 @@ from .coordinator import (
 )
 
 
+def _serial_number(device_name: str) -> str:
+    """Return the serial part of a device name such as ``Luba-XXXXXX``."""
+    _, sep, serial = device_name.partition("-")
+    return serial if sep else device_name
+
+
 class MammotionBaseEntity(CoordinatorEntity[MammotionBaseUpdateCoordinator[Any]]):  # type: ignore[misc]
     """Representation of a Mammotion Lawn Mower."""
 
@@ -80,7 +86,7 @@ class MammotionBaseEntity(CoordinatorEntity[MammotionBaseUpdateCoordinator[Any]]
         return DeviceInfo(
             identifiers={(DOMAIN, self.coordinator.unique_name)},
             manufacturer="Mammotion",
-            serial_number=self.coordinator.device_name.split("-", 1)[-1],
+            serial_number=_serial_number(self.coordinator.device_name),
             model_id=model_id,
             name=self.coordinator.device_name,
             sw_version=swversion,
@@ -310,7 +316,7 @@ class MammotionCameraBaseEntity(Camera, ABC):  # type: ignore[misc]
         return DeviceInfo(
             identifiers={(DOMAIN, self.coordinator.unique_name)},
             manufacturer="Mammotion",
-            serial_number=self.coordinator.device_name.split("-", 1)[-1],
+            serial_number=_serial_number(self.coordinator.device_name),
             model_id=model_id,
             name=self.coordinator.device_name,
             sw_version=swversion,
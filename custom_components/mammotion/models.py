@@ -16,7 +16,7 @@ from .coordinator import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class MammotionMowerData:
     """Data for a mower information."""
 
@@ -31,7 +31,7 @@ class MammotionMowerData:
     device: Device
 
 
-@dataclass
+@dataclass(slots=True)
 class MammotionRTKData:
     """Data for RTK information."""
 
@@ -42,7 +42,7 @@ class MammotionRTKData:
     device: Device
 
 
-@dataclass
+@dataclass(slots=True)
 class MammotionSpinoData:
     """Data for a Spino pool cleaner."""
 
@@ -53,7 +53,7 @@ class MammotionSpinoData:
     device: Device
 
 
-@dataclass
+@dataclass(slots=True)
 class MammotionDevices:
     """Data for the Mammotion integration."""
 
@@ -208,13 +208,18 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Mammotion number entities."""
     mammotion_devices = entry.runtime_data.mowers
+    device_config: DeviceConfig | None = None
 
     for mower in mammotion_devices:
-        limits: DeviceLimits | None = DeviceConfig().get_working_parameters(
-            mower.device.product_key
-        )
+        limits: DeviceLimits | None
         if handle := mower.api.get_device_by_name(mower.name):
             limits = handle.device_limits
+        else:
+            # Only fall back to the static product table when the client has no
+            # live device, and build that table at most once per platform setup.
+            if device_config is None:
+                device_config = DeviceConfig()
+            limits = device_config.get_working_parameters(mower.device.product_key)
         entities: list[MammotionConfigNumberEntity] = []
 
         for entity_description in NUMBER_WORKING_ENTITIES: